@@ -2,4 +2,12 @@
 
 """TauBase is a web application based on BEL Commons to convey the Tau knowledge graph."""
 
-from .repository import repository
+
+def __getattr__(name: str):
+    """Load the repository lazily so the lite backend can be imported without PyBEL or the HBP repositories."""
+    if name == 'repository':
+        from .repository import repository
+        # Importing the submodule binds its name on the package, so bind the repository over it
+        globals()['repository'] = repository
+        return repository
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
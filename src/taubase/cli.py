@@ -3,13 +3,12 @@
 """Run TauBase."""
 
 import logging
+import os
 import sys
 from collections import Counter
+from typing import Optional
 
 import click
-from pybel.struct.summary import iterate_pubmed_identifiers
-
-from .repository import repository
 
 
 @click.group()
@@ -22,6 +21,7 @@ def main():
 @click.option('-c', '--no-use-cached', is_flag=True)
 def export(directory: str, no_use_cached: bool):
     """Export the repository."""
+    from .repository import repository
     repository.get_graph(
         directory=directory,
         use_cached=(directory or not no_use_cached),
@@ -34,6 +34,8 @@ def export(directory: str, no_use_cached: bool):
 @click.option('-o', '--output', type=click.File('w'), default=sys.stdout)
 def citations(directory: str, no_use_cached: bool, output):
     """Export the repository."""
+    from pybel.struct.summary import iterate_pubmed_identifiers
+    from .repository import repository
     graph = repository.get_graph(
         directory=directory,
         use_cached=(directory or not no_use_cached),
@@ -50,18 +52,51 @@ def citations(directory: str, no_use_cached: bool, output):
         print(pmid, count, file=output, sep='\t')
 
 
+@main.command()
+@click.argument('previous', type=click.Path(dir_okay=False, file_okay=True, exists=True))
+@click.argument('current', type=click.Path(dir_okay=False, file_okay=True, exists=True), required=False)
+@click.option('-o', '--output', type=click.File('w'), default=sys.stdout)
+def diff(previous: str, current: str, output):
+    """Output the NDJSON patches between two build manifests.
+
+    If the current manifest is not given, the one from the last export is used. Manifests of earlier
+    exports are kept in the manifests/ subdirectory of the export directory.
+    """
+    from .diff import iterate_patches, load_manifest, write_patches
+    if current is None:
+        from .repository import repository
+        current = os.path.join(repository.directory, f'{repository.name}.manifest.json')
+        if not os.path.exists(current):
+            raise click.UsageError(f'No manifest from a previous export at {current}. Run taubase export first.')
+
+    write_patches(iterate_patches(load_manifest(previous), load_manifest(current)), output)
+
+
 @main.command()
 @click.option('--host', type=str, default='0.0.0.0', help='Flask host.', show_default=True)
 @click.option('--port', type=int, default=5000, help='Flask port.', show_default=True)
 @click.option('-v', '--verbose', is_flag=True)
-def web(host: str, port: int, verbose: bool):
+@click.option('--lite', is_flag=True, help='Serve from the SIF and GMT exports.')
+@click.option('--sif', type=click.Path(dir_okay=False, file_okay=True, exists=True), envvar='TAUBASE_SIF',
+              help='The SIF export used in lite mode. Defaults to the one in the data directory.')
+@click.option('--gmt', type=click.Path(dir_okay=False, file_okay=True, exists=True), envvar='TAUBASE_GMT',
+              help='The GMT export used in lite mode. Defaults to the one in the data directory.')
+def web(host: str, port: int, verbose: bool, lite: bool, sif: Optional[str], gmt: Optional[str]):
     """Run the TauBase web application."""
     if verbose:
         logging.basicConfig(level=logging.INFO)
         logging.getLogger('pybel').setLevel(logging.INFO)
         logging.getLogger('hbp').setLevel(logging.INFO)
 
-    from .wsgi import app
+    if lite:
+        # The lite app builds its graph on import, so the paths are passed through the environment
+        if sif:
+            os.environ['TAUBASE_SIF'] = sif
+        if gmt:
+            os.environ['TAUBASE_GMT'] = gmt
+        from .wsgi_lite import app
+    else:
+        from .wsgi import app
     app.run(host=host, port=port)
 
 
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+"""Constants for TauBase."""
+
+import os
+
+__all__ = [
+    'HERE',
+    'DATA_DIRECTORY',
+    'SIF_PATH',
+    'GMT_PATH',
+]
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+DATA_DIRECTORY = os.path.abspath(os.path.join(HERE, os.pardir, os.pardir, 'data'))
+
+#: The SIF export shipped in the data directory
+SIF_PATH = os.path.join(DATA_DIRECTORY, 'taubase.bel.sif')
+#: The GMT export shipped in the data directory
+GMT_PATH = os.path.join(DATA_DIRECTORY, 'taubase.bel.gmt')
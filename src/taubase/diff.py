@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""Functions for computing deltas between builds of the knowledge graph.
+
+A build's manifest records a stable hash for each of its nodes and edges. Comparing the manifests of two
+builds gives the nodes and edges that were added and removed, which are written as newline-delimited
+JSON (NDJSON) patches that consumers can apply in time proportional to what changed.
+
+Patches are ordered so they can be applied one after another: edge removals, node removals, node
+additions, then edge additions.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Iterable, Mapping, TextIO
+
+from pybel import BELGraph
+from pybel.constants import (
+    ANNOTATIONS, CITATION, CITATION_REFERENCE, CITATION_TYPE, EVIDENCE, OBJECT, RELATION, SUBJECT,
+)
+from pybel.dsl import BaseEntity
+
+__all__ = [
+    'hash_node',
+    'hash_edge',
+    'get_version_slug',
+    'get_manifest',
+    'load_manifest',
+    'dump_manifest',
+    'iterate_patches',
+    'write_patches',
+]
+
+Manifest = Mapping[str, Any]
+Patch = Mapping[str, Any]
+
+
+def hash_node(node: BaseEntity) -> str:
+    """Get a stable hash for the node based on its BEL."""
+    return hashlib.sha512(node.as_bel().encode('utf-8')).hexdigest()
+
+
+def hash_edge(source: BaseEntity, target: BaseEntity, data: Mapping[str, Any]) -> str:
+    """Get a stable hash for the edge based on its BEL, citation, evidence, and annotations.
+
+    Unlike :func:`pybel.utils.hash_edge`, this covers the annotations and does not depend on the pickle
+    protocol of the Python version that built the graph.
+    """
+    canonical = json.dumps(
+        [
+            source.as_bel(),
+            target.as_bel(),
+            data[RELATION],
+            data.get(SUBJECT),
+            data.get(OBJECT),
+            data.get(CITATION),
+            data.get(EVIDENCE),
+            data.get(ANNOTATIONS),
+        ],
+        sort_keys=True,
+    )
+    return hashlib.sha512(canonical.encode('utf-8')).hexdigest()
+
+
+def get_version_slug(version: str) -> str:
+    """Get a version that can be used in a file name.
+
+    For example, ``0.0.1-dev (0.0.5/0.1.1)`` becomes ``0.0.1-dev_0.0.5_0.1.1``.
+    """
+    return re.sub(r'[^\w.-]+', '_', version).strip('_')
+
+
+def get_manifest(graph: BELGraph) -> Manifest:
+    """Get a manifest of the nodes and edges in the graph, keyed by their stable hashes."""
+    node_hashes = {
+        node: hash_node(node)
+        for node in graph
+    }
+
+    edges = {}
+    for source, target, data in graph.edges(data=True):
+        citation = data.get(CITATION)
+        edges[hash_edge(source, target, data)] = {
+            'source': node_hashes[source],
+            'target': node_hashes[target],
+            'relation': data[RELATION],
+            'bel': graph.edge_to_bel(source, target, data, sep=' '),
+            'citation': citation and [citation[CITATION_TYPE], citation[CITATION_REFERENCE]],
+            'evidence': data.get(EVIDENCE),
+            'annotations': data.get(ANNOTATIONS),
+        }
+
+    return {
+        'name': graph.name,
+        'version': graph.version,
+        'nodes': {
+            node_hash: node.as_bel()
+            for node, node_hash in node_hashes.items()
+        },
+        'edges': edges,
+    }
+
+
+def load_manifest(path: str) -> Manifest:
+    """Load a manifest from a JSON file."""
+    with open(path) as file:
+        return json.load(file)
+
+
+def dump_manifest(manifest: Manifest, path: str) -> None:
+    """Write a manifest to a JSON file."""
+    with open(path, 'w') as file:
+        json.dump(manifest, file)
+
+
+def iterate_patches(old: Manifest, new: Manifest) -> Iterable[Patch]:
+    """Iterate over the patches from the old manifest to the new manifest in the order they should be applied."""
+    old_nodes, new_nodes = old['nodes'], new['nodes']
+    old_edges, new_edges = old['edges'], new['edges']
+
+    for edge_hash in sorted(old_edges.keys() - new_edges.keys()):
+        yield {'op': 'remove', 'type': 'edge', 'id': edge_hash}
+
+    for node_hash in sorted(old_nodes.keys() - new_nodes.keys()):
+        yield {'op': 'remove', 'type': 'node', 'id': node_hash}
+
+    for node_hash in sorted(new_nodes.keys() - old_nodes.keys()):
+        yield {'op': 'add', 'type': 'node', 'id': node_hash, 'bel': new_nodes[node_hash]}
+
+    for edge_hash in sorted(new_edges.keys() - old_edges.keys()):
+        yield {'op': 'add', 'type': 'edge', 'id': edge_hash, **new_edges[edge_hash]}
+
+
+def write_patches(patches: Iterable[Patch], file: TextIO) -> int:
+    """Write patches as NDJSON and return how many were written."""
+    count = 0
+    for patch in patches:
+        print(json.dumps(patch, separators=(',', ':')), file=file)
+        count += 1
+    return count
@@ -2,9 +2,13 @@
 
 """A distributed repository."""
 
+import hashlib
+import itertools as itt
+import logging
 import os
 import pickle
-from typing import List, Mapping, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Mapping, Optional, Union
 
 import pybel
 from bel_enrichment import BELSheetsRepository
@@ -12,10 +16,22 @@ from bel_repository import BELMetadata, BELRepository
 from bel_repository.utils import serialize_authors
 from pybel import BELGraph, union
 
+from .diff import (
+    dump_manifest, get_manifest, get_version_slug, hash_edge, iterate_patches, load_manifest, write_patches,
+)
+from .getters import get_modifier_site_matrix, is_hgnc_protein
+
 __all__ = [
     'DistributedRepo',
+    'get_graph_fingerprint',
+    'to_indra_statements_parallel',
 ]
 
+logger = logging.getLogger(__name__)
+
+#: The number of edges converted to INDRA statements by each worker at a time
+INDRA_CHUNK_SIZE = 2000
+
 
 class DistributedRepo:
     """A repository dependent on several BEL repositories."""
@@ -91,6 +107,8 @@ class DistributedRepo:
 
         pybel.to_pickle(rv, pickle_path)
 
+        self.write_delta(rv, directory)
+
         nodelink_path = os.path.join(directory, f'{self.name}.bel.nodelink.json')
         pybel.to_json_path(rv, nodelink_path)
 
@@ -104,13 +122,14 @@ class DistributedRepo:
         pybel.to_graphml(rv, graphml_path)
 
         try:
-            statements = pybel.to_indra_statements(rv)
+            self.get_indra_statements(directory, graph=rv)
+        except ImportError:
+            pass
+
+        try:
+            get_modifier_site_matrix(rv).to_parquet(os.path.join(directory, f'{self.name}.MAPT.modifiers.parquet'))
         except ImportError:
             pass
-        else:
-            indra_path = os.path.join(directory, f'{self.name}.indra.pickle')
-            with open(indra_path, 'wb') as file:
-                pickle.dump(statements, file)
 
         try:
             from pybel_cx import to_cx_file
@@ -132,6 +151,169 @@ class DistributedRepo:
 
         return rv
 
-    def get_indra_statements(self, directory: str, use_cached: bool = True) -> List['indra.statements.Statement']:
-        """Get INDRA statements for the graph."""
-        return pybel.to_indra_statements(self.get_graph(directory, use_cached=use_cached))
+    def write_delta(self, graph: BELGraph, directory: str) -> Optional[int]:
+        """Write the nodes and edges changed since the previous build as an NDJSON patch file.
+
+        Each build's manifest is kept in the ``manifests`` subdirectory, so consumers that skipped a release can
+        catch up with ``taubase diff``. The latest manifest is also written to ``<name>.manifest.json``, and the
+        patches from the one it replaces are written to the ``deltas`` subdirectory.
+
+        :returns: The number of patches written, or None if there was no previous build
+        """
+        manifest = get_manifest(graph)
+        slug = get_version_slug(manifest['version'])
+
+        manifests_directory = os.path.join(directory, 'manifests')
+        os.makedirs(manifests_directory, exist_ok=True)
+        dump_manifest(manifest, os.path.join(manifests_directory, f'{self.name}-{slug}.manifest.json'))
+
+        manifest_path = os.path.join(directory, f'{self.name}.manifest.json')
+        rv = None
+        if os.path.exists(manifest_path):
+            previous_manifest = load_manifest(manifest_path)
+            previous_slug = get_version_slug(previous_manifest['version'])
+
+            deltas_directory = os.path.join(directory, 'deltas')
+            os.makedirs(deltas_directory, exist_ok=True)
+            delta_path = os.path.join(deltas_directory, f'{self.name}-{previous_slug}-to-{slug}.ndjson')
+            with open(delta_path, 'w') as file:
+                rv = write_patches(iterate_patches(previous_manifest, manifest), file)
+
+            logger.info('wrote %d patches since %s to %s', rv, previous_manifest['version'], delta_path)
+
+        dump_manifest(manifest, manifest_path)
+        return rv
+
+    def get_indra_statements(
+            self,
+            directory: Optional[str] = None,
+            use_cached: bool = True,
+            hgnc_gene_symbol: Optional[str] = None,
+            graph: Optional[BELGraph] = None,
+            chunk_size: int = INDRA_CHUNK_SIZE,
+            max_workers: Optional[int] = None,
+    ) -> List['indra.statements.Statement']:
+        """Get INDRA statements for the graph.
+
+        Statements are loaded from the cache if its ``.fingerprint`` sidecar file matches the graph's
+        fingerprint. Otherwise, the edges are split into chunks and converted in a process pool.
+
+        :param directory: The directory in which the graph and statements are cached
+        :param use_cached: Should the cached graph be used, if available? If the graph is given, should the
+         cached statements be used? Rebuilding the graph with :meth:`get_graph` also refreshes the statements.
+        :param hgnc_gene_symbol: If given, only convert the edges incident to this HGNC protein (e.g., MAPT)
+        :param graph: A pre-built graph to convert. If not given, it is got with :meth:`get_graph`.
+        :param chunk_size: The number of edges converted by each worker at a time
+        :param max_workers: The number of processes in the pool. Defaults to the number of CPUs.
+        :raises ImportError: if INDRA is not installed
+        """
+        if directory is None:
+            if self.directory is None:
+                raise ValueError
+            directory = self.directory
+
+        _require_indra()
+
+        if graph is None:
+            graph = self.get_graph(directory, use_cached=use_cached)
+            # Rebuilding the graph already converts and caches its statements, so they don't need to be
+            # converted again. The fingerprint still guards against a stale cache.
+            use_cached = True
+
+        if hgnc_gene_symbol is None:
+            indra_prefix = os.path.join(directory, f'{self.name}.indra')
+        else:
+            indra_prefix = os.path.join(directory, f'{self.name}.{hgnc_gene_symbol}.indra')
+        indra_path = f'{indra_prefix}.pickle'
+        fingerprint_path = f'{indra_prefix}.fingerprint'
+
+        fingerprint = get_graph_fingerprint(graph)
+
+        if use_cached and os.path.exists(indra_path) and os.path.exists(fingerprint_path):
+            with open(fingerprint_path) as file:
+                cached_fingerprint = file.read().strip()
+            if cached_fingerprint == fingerprint:
+                with open(indra_path, 'rb') as file:
+                    return pickle.load(file)
+        if use_cached and os.path.exists(indra_path):
+            logger.info('cached INDRA statements in %s are stale', indra_path)
+
+        statements = to_indra_statements_parallel(
+            graph,
+            hgnc_gene_symbol=hgnc_gene_symbol,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+        with open(indra_path, 'wb') as file:
+            pickle.dump(statements, file)
+        # The fingerprint is written last so an interrupted export leaves the cache stale rather than wrong
+        with open(fingerprint_path, 'w') as file:
+            print(fingerprint, file=file)
+
+        return statements
+
+
+def _require_indra() -> None:
+    """Fail before doing any work if INDRA, which is not a requirement of TauBase, is not installed.
+
+    :raises ImportError: if INDRA is not installed
+    """
+    import indra  # noqa: F401
+
+
+def get_graph_fingerprint(graph: BELGraph) -> str:
+    """Get a hash of the graph that is independent of the order in which its edges were added."""
+    edge_hashes = sorted(
+        hash_edge(source, target, data)
+        for source, target, data in graph.edges(data=True)
+    )
+    return hashlib.sha512('\n'.join(edge_hashes).encode('utf-8')).hexdigest()
+
+
+def _iterate_edge_chunks(
+        graph: BELGraph,
+        chunk_size: int,
+        hgnc_gene_symbol: Optional[str] = None,
+) -> Iterable[BELGraph]:
+    """Split the edges of the graph into subgraphs with at most the given number of edges."""
+    edges = graph.edges(keys=True, data=True)
+    if hgnc_gene_symbol is not None:
+        edges = (
+            (source, target, key, data)
+            for source, target, key, data in edges
+            if is_hgnc_protein(source, hgnc_gene_symbol) or is_hgnc_protein(target, hgnc_gene_symbol)
+        )
+
+    edges = iter(edges)
+    while True:
+        chunk_edges = list(itt.islice(edges, chunk_size))
+        if not chunk_edges:
+            return
+
+        chunk = graph.__class__()
+        chunk.graph.update(graph.graph)
+        for source, target, key, data in chunk_edges:
+            chunk.add_edge(source, target, key=key, **data)
+        yield chunk
+
+
+def to_indra_statements_parallel(
+        graph: BELGraph,
+        hgnc_gene_symbol: Optional[str] = None,
+        chunk_size: int = INDRA_CHUNK_SIZE,
+        max_workers: Optional[int] = None,
+) -> List['indra.statements.Statement']:
+    """Convert the graph to INDRA statements in chunks of edges using a process pool.
+
+    :raises ImportError: if INDRA is not installed
+    """
+    _require_indra()
+    chunks = list(_iterate_edge_chunks(graph, chunk_size=chunk_size, hgnc_gene_symbol=hgnc_gene_symbol))
+    if not chunks:
+        return []
+    if 1 == len(chunks):
+        return pybel.to_indra_statements(chunks[0])
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(itt.chain.from_iterable(executor.map(pybel.to_indra_statements, chunks)))
@@ -3,16 +3,19 @@
 """Functions for filtering the knowledge graph."""
 
 import itertools as itt
+import weakref
 from functools import partial
-from typing import Iterable, List, Tuple
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from pybel import BELGraph
 from pybel.constants import (
-    ACTIVITY, CAUSAL_INCREASE_RELATIONS, CAUSAL_RELATIONS, CITATION, CITATION_REFERENCE, CITATION_TYPE,
-    DIRECT_CAUSAL_RELATIONS, EFFECT, EVIDENCE, IDENTIFIER, LINE, MODIFIER, NAME, PMOD_CODE, PMOD_POSITION, RELATION,
-    SUBJECT,
+    ACTIVITY, CAUSAL_DECREASE_RELATIONS, CAUSAL_INCREASE_RELATIONS, CAUSAL_RELATIONS, CITATION, CITATION_REFERENCE,
+    CITATION_TYPE, DIRECT_CAUSAL_RELATIONS, EFFECT, EVIDENCE, IDENTIFIER, LINE, MODIFIER, NAME, PMOD_CODE,
+    PMOD_POSITION, RELATION, SUBJECT,
 )
 from pybel.dsl import BaseEntity, Fragment, Gene, Hgvs, Protein, ProteinModification
 
@@ -25,7 +28,7 @@ def get_modifiers(graph: BELGraph, hgnc_gene_symbol: str, only_direct: bool = Fa
     - Namespace
     - Name
     - Contact
-    - Polarity
+    - Polarity (None if the relation has no direction)
     - Modification type
     - Residue
     - Position
@@ -85,7 +88,7 @@ def _get_protein_modifiers_rows(
             # source.identifier,
             source.name,
             data[RELATION] in DIRECT_CAUSAL_RELATIONS,
-            data[RELATION] in CAUSAL_INCREASE_RELATIONS,
+            _get_polarity(data[RELATION]),
             variant[IDENTIFIER][NAME],
             variant.get(PMOD_CODE),
             variant.get(PMOD_POSITION),
@@ -96,9 +99,195 @@ def _get_protein_modifiers_rows(
         )
 
 
+def _get_polarity(relation: str) -> Optional[bool]:
+    """Get True for an increase, False for a decrease, or None for a relation like ``regulates`` without one."""
+    if relation in CAUSAL_INCREASE_RELATIONS:
+        return True
+    if relation in CAUSAL_DECREASE_RELATIONS:
+        return False
+    return None
+
+
 get_tau_modifiers = partial(get_modifiers, hgnc_gene_symbol='MAPT')
 
 
+#: The categories counted by the :class:`ModifierSiteMatrix` besides the total
+MODIFIER_SITE_CATEGORIES = ('direct', 'indirect', 'increase', 'decrease', 'nonpolar', 'manual', 'automatic')
+
+Site = Tuple[str, Optional[str], Optional[int]]
+
+
+class ModifierSiteMatrix:
+    """Counts of edges from modifier entities to the protein modification sites of a target protein.
+
+    The rows are modifier entities as (namespace, name) pairs and the columns are sites as
+    (modification, residue, position) triples. There is one sparse matrix for each of ``total`` and
+    the categories in :data:`MODIFIER_SITE_CATEGORIES`, where ``nonpolar`` counts causal relations without
+    a direction, like ``regulates``.
+    """
+
+    def __init__(
+            self,
+            hgnc_gene_symbol: str,
+            modifiers: List[Tuple[str, str]],
+            sites: List[Site],
+            counts: Mapping[str, sparse.csr_matrix],
+    ) -> None:
+        """Initialize the matrix.
+
+        :param hgnc_gene_symbol: The HGNC gene symbol of the target protein
+        :param modifiers: The modifier entities, indexed by row
+        :param sites: The modification sites, indexed by column
+        :param counts: A mapping from ``total`` and each category to a sparse matrix of counts
+        """
+        self.hgnc_gene_symbol = hgnc_gene_symbol
+        self.modifiers = modifiers
+        self.sites = sites
+        self.counts = counts
+
+    @classmethod
+    def from_graph(cls, graph: BELGraph, hgnc_gene_symbol: str) -> 'ModifierSiteMatrix':
+        """Build the matrix with one scan over the edges of the graph."""
+        rows = list(_get_protein_modifiers_rows(graph, hgnc_gene_symbol=hgnc_gene_symbol))
+
+        modifiers = sorted({(namespace, name) for namespace, name, *_ in rows})
+        sites = sorted(
+            {(modification, residue, position) for _, _, _, _, modification, residue, position, *_ in rows},
+            key=lambda site: (site[2] or 0, site[1] or '', site[0]),
+        )
+        modifier_to_id = {modifier: i for i, modifier in enumerate(modifiers)}
+        site_to_id = {site: i for i, site in enumerate(sites)}
+
+        row_ids = np.array([modifier_to_id[row[0], row[1]] for row in rows], dtype=np.int64)
+        column_ids = np.array([site_to_id[row[4], row[5], row[6]] for row in rows], dtype=np.int64)
+        direct = np.array([row[2] for row in rows], dtype=bool)
+        polarities = [row[3] for row in rows]
+        increase = np.array([polarity is True for polarity in polarities], dtype=bool)
+        decrease = np.array([polarity is False for polarity in polarities], dtype=bool)
+        automatic = np.array([row[10] for row in rows], dtype=bool)
+
+        masks = {
+            'total': np.ones(len(rows), dtype=bool),
+            'direct': direct,
+            'indirect': ~direct,
+            'increase': increase,
+            'decrease': decrease,
+            'nonpolar': ~(increase | decrease),
+            'manual': ~automatic,
+            'automatic': automatic,
+        }
+        shape = (len(modifiers), len(sites))
+        counts = {
+            category: sparse.coo_matrix(
+                (np.ones(mask.sum(), dtype=np.int64), (row_ids[mask], column_ids[mask])),
+                shape=shape,
+            ).tocsr()
+            for category, mask in masks.items()
+        }
+
+        return cls(hgnc_gene_symbol=hgnc_gene_symbol, modifiers=modifiers, sites=sites, counts=counts)
+
+    def to_dense_frame(self, category: str = 'total') -> pd.DataFrame:
+        """Get a dense data frame of the counts in the given category for plotting a heatmap."""
+        return pd.DataFrame(
+            self.counts[category].toarray(),
+            index=pd.MultiIndex.from_tuples(self.modifiers, names=['namespace', 'name']),
+            columns=pd.MultiIndex.from_tuples(self.sites, names=['modification', 'residue', 'position']),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get a long data frame with a row for each modifier and site with a column for each count."""
+        total = self.counts['total'].tocoo()
+        return pd.DataFrame({
+            'namespace': [self.modifiers[i][0] for i in total.row],
+            'name': [self.modifiers[i][1] for i in total.row],
+            'modification': [self.sites[j][0] for j in total.col],
+            'residue': [self.sites[j][1] for j in total.col],
+            'position': pd.array([self.sites[j][2] for j in total.col], dtype='Int64'),
+            'total': total.data,
+            **{
+                category: self._get_counts_at(category, total.row, total.col)
+                for category in MODIFIER_SITE_CATEGORIES
+            },
+        })
+
+    def _get_counts_at(self, category: str, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """Get the counts in the given category at the given coordinates as a vector, even if there are none."""
+        if 0 == len(rows):
+            return np.zeros(0, dtype=np.int64)
+        return np.asarray(self.counts[category].tocsr()[rows, columns]).ravel()
+
+    def to_parquet(self, path: str) -> None:
+        """Write the long data frame to a Parquet file.
+
+        :raises ImportError: if neither :mod:`pyarrow` nor :mod:`fastparquet` is installed
+        """
+        self.to_frame().to_parquet(path, index=False)
+
+    def to_dict(self) -> Mapping[str, Any]:
+        """Get a JSON-serializable dictionary with the counts in coordinate format."""
+        rv = {
+            'hgnc_gene_symbol': self.hgnc_gene_symbol,
+            'modifiers': self.modifiers,
+            'sites': self.sites,
+            'counts': {},
+        }
+        for category, matrix in self.counts.items():
+            coo = matrix.tocoo()
+            rv['counts'][category] = {
+                'row': coo.row.tolist(),
+                'col': coo.col.tolist(),
+                'data': coo.data.tolist(),
+            }
+        return rv
+
+    def get_top_modifiers(self, k: int = 5, category: str = 'total') -> pd.DataFrame:
+        """Get the ``k`` modifiers with the highest counts in the given category for each site.
+
+        Only the non-zero counts in each column of the sparse matrix are partitioned. Ties are ranked in the
+        order of the modifiers, except at the cutoff, where which of the tied modifiers is kept is arbitrary.
+        """
+        matrix = self.counts[category].tocsc()
+        matrix.eliminate_zeros()
+
+        # Start from empty vectors so a matrix without any sites gives an empty data frame
+        columns, ranks, modifier_ids, counts = ([np.zeros(0, dtype=np.int64)] for _ in range(4))
+        for column in range(matrix.shape[1]):
+            start, end = matrix.indptr[column], matrix.indptr[column + 1]
+            column_counts, column_modifier_ids = matrix.data[start:end], matrix.indices[start:end]
+            if k < len(column_counts):
+                top = np.argpartition(-column_counts, k - 1)[:k]
+                column_counts, column_modifier_ids = column_counts[top], column_modifier_ids[top]
+            order = np.lexsort((column_modifier_ids, -column_counts))
+
+            columns.append(np.full(len(order), column))
+            ranks.append(np.arange(1, len(order) + 1))
+            modifier_ids.append(column_modifier_ids[order])
+            counts.append(column_counts[order])
+
+        columns, modifier_ids = np.concatenate(columns), np.concatenate(modifier_ids)
+        return pd.DataFrame({
+            'modification': [self.sites[j][0] for j in columns],
+            'residue': [self.sites[j][1] for j in columns],
+            'position': pd.array([self.sites[j][2] for j in columns], dtype='Int64'),
+            'rank': np.concatenate(ranks),
+            'namespace': [self.modifiers[i][0] for i in modifier_ids],
+            'name': [self.modifiers[i][1] for i in modifier_ids],
+            'count': np.concatenate(counts),
+        })
+
+
+_modifier_site_matrices = weakref.WeakKeyDictionary()
+
+
+def get_modifier_site_matrix(graph: BELGraph, hgnc_gene_symbol: str = 'MAPT') -> ModifierSiteMatrix:
+    """Get the modifier by site matrix for the given protein, which is only built once per graph."""
+    matrices = _modifier_site_matrices.setdefault(graph, {})
+    if hgnc_gene_symbol not in matrices:
+        matrices[hgnc_gene_symbol] = ModifierSiteMatrix.from_graph(graph, hgnc_gene_symbol)
+    return matrices[hgnc_gene_symbol]
+
+
 def get_kinases(graph: BELGraph, only_direct: bool = False) -> pd.DataFrame:
     """Get a data frame with the proteins that are acting as kinases.
 
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+"""A lightweight backend that serves the knowledge graph from its SIF and GMT exports.
+
+The lite backend reads the SIF and GMT exports into an array-backed adjacency structure, so it does not
+need PyBEL or any of the HBP content repositories to be installed. The exports are shipped in the data
+directory of a source checkout. Otherwise, they have to be provided with the ``TAUBASE_SIF`` and
+``TAUBASE_GMT`` environment variables.
+"""
+
+import os
+import re
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .constants import GMT_PATH, SIF_PATH
+
+__all__ = [
+    'LiteGraph',
+    'get_lite_graph',
+    'is_hgnc_protein_bel',
+    'get_lite_edges',
+    'get_lite_neighborhood',
+]
+
+EdgeTuple = Tuple[str, str, str]
+
+#: Functions that wrap a term in the SIF export where PyBEL would put a modifier on the edge instead
+MODIFIER_FUNCTIONS = ('act', 'deg', 'tloc', 'sec', 'surf')
+
+
+class LiteGraph:
+    """A read-only multi-digraph of BEL terms stored in compressed sparse row (CSR) arrays."""
+
+    def __init__(
+            self,
+            *,
+            name: str,
+            nodes: List[str],
+            relations: List[str],
+            sources: array,
+            relation_ids: array,
+            targets: array,
+            gene_sets: Optional[Mapping[str, List[str]]] = None,
+    ) -> None:
+        """Initialize the lite graph.
+
+        :param name: The name of the graph
+        :param nodes: The BEL terms, indexed by node identifier
+        :param relations: The relations, indexed by relation identifier
+        :param sources: The source node identifier of each edge
+        :param relation_ids: The relation identifier of each edge
+        :param targets: The target node identifier of each edge
+        :param gene_sets: A mapping from gene set names to their genes
+        """
+        self.name = name
+        self.nodes = nodes
+        self.node_to_id: Dict[str, int] = {node: node_id for node_id, node in enumerate(nodes)}
+        self.relations = relations
+        self.sources = sources
+        self.relation_ids = relation_ids
+        self.targets = targets
+        self.gene_sets = gene_sets or {}
+
+        self._out_offsets, self._out_edges = _build_csr(self.sources, len(self.nodes))
+        self._in_offsets, self._in_edges = _build_csr(self.targets, len(self.nodes))
+
+    @classmethod
+    def from_paths(cls, sif_path: str, gmt_path: Optional[str] = None, name: Optional[str] = None) -> 'LiteGraph':
+        """Stream-parse a SIF file and optionally a GMT file."""
+        nodes, node_to_id = [], {}
+        relations, relation_to_id = [], {}
+        sources, relation_ids, targets = array('I'), array('I'), array('I')
+
+        def _get_id(key: str, keys: List[str], key_to_id: Dict[str, int]) -> int:
+            key_id = key_to_id.get(key)
+            if key_id is None:
+                key_id = key_to_id[key] = len(keys)
+                keys.append(key)
+            return key_id
+
+        with open(sif_path) as file:
+            for line in file:
+                line = line.rstrip('\n')
+                if not line:
+                    continue
+                source, relation, target = line.split('\t')
+                sources.append(_get_id(source, nodes, node_to_id))
+                relation_ids.append(_get_id(relation, relations, relation_to_id))
+                targets.append(_get_id(target, nodes, node_to_id))
+
+        gene_sets = None if gmt_path is None else _read_gmt(gmt_path)
+
+        if name is None:
+            name = next(iter(gene_sets), None) if gene_sets else None
+        if name is None:
+            name = os.path.basename(sif_path).split('.')[0]
+
+        return cls(
+            name=name,
+            nodes=nodes,
+            relations=relations,
+            sources=sources,
+            relation_ids=relation_ids,
+            targets=targets,
+            gene_sets=gene_sets,
+        )
+
+    def number_of_nodes(self) -> int:
+        """Get the number of nodes."""
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        """Get the number of edges."""
+        return len(self.sources)
+
+    def summary_dict(self) -> Mapping[str, int]:
+        """Summarize the graph like :meth:`pybel.BELGraph.summary_dict`."""
+        return {
+            'Number of Nodes': self.number_of_nodes(),
+            'Number of Edges': self.number_of_edges(),
+            'Number of Relations': len(self.relations),
+            'Number of Genes': len(self.get_genes()),
+        }
+
+    def get_edge(self, edge_id: int) -> EdgeTuple:
+        """Get the source BEL, relation, and target BEL of the given edge."""
+        return (
+            self.nodes[self.sources[edge_id]],
+            self.relations[self.relation_ids[edge_id]],
+            self.nodes[self.targets[edge_id]],
+        )
+
+    def iterate_edges(self) -> Iterable[EdgeTuple]:
+        """Iterate over all edges."""
+        for edge_id in range(self.number_of_edges()):
+            yield self.get_edge(edge_id)
+
+    def out_edge_ids(self, node_id: int) -> array:
+        """Get the identifiers of the edges whose source is the given node."""
+        return self._out_edges[self._out_offsets[node_id]:self._out_offsets[node_id + 1]]
+
+    def in_edge_ids(self, node_id: int) -> array:
+        """Get the identifiers of the edges whose target is the given node."""
+        return self._in_edges[self._in_offsets[node_id]:self._in_offsets[node_id + 1]]
+
+    def get_neighborhood_edge_ids(self, node_ids: Iterable[int]) -> List[int]:
+        """Get the sorted identifiers of the edges incident to any of the given nodes."""
+        edge_ids: Set[int] = set()
+        for node_id in node_ids:
+            edge_ids.update(self.out_edge_ids(node_id))
+            edge_ids.update(self.in_edge_ids(node_id))
+        return sorted(edge_ids)
+
+    def get_genes(self) -> Set[str]:
+        """Get the union of all gene sets."""
+        return {
+            gene
+            for genes in self.gene_sets.values()
+            for gene in genes
+        }
+
+
+def _build_csr(keys: array, size: int) -> Tuple[array, array]:
+    """Group the indexes of the keys by their value with a counting sort.
+
+    :returns: An offsets array of length ``size + 1`` and an array of indexes into the keys such that the
+     indexes with value ``i`` are between ``offsets[i]`` and ``offsets[i + 1]``.
+    """
+    offsets = array('I', bytes(array('I').itemsize * (size + 1)))
+    for key in keys:
+        offsets[key + 1] += 1
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+
+    positions = offsets[:-1]
+    indexes = array('I', bytes(array('I').itemsize * len(keys)))
+    for index, key in enumerate(keys):
+        indexes[positions[key]] = index
+        positions[key] += 1
+
+    return offsets, indexes
+
+
+def _read_gmt(path: str) -> Mapping[str, List[str]]:
+    """Read a GMT file, including the single gene set ``# name`` format written by :func:`pybel.to_gsea`."""
+    rv = {}
+    name = None
+    with open(path) as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#'):
+                name = line.lstrip('#').strip()
+                rv.setdefault(name, [])
+                continue
+            parts = line.split('\t')
+            if 1 < len(parts):
+                rv.setdefault(parts[0], []).extend(part for part in parts[2:] if part)
+            else:
+                rv.setdefault(name, []).append(line)
+    return rv
+
+
+def get_lite_graph(sif_path: Optional[str] = None, gmt_path: Optional[str] = None) -> LiteGraph:
+    """Get the lite graph from the SIF and GMT exports.
+
+    If not given, the paths are taken from the ``TAUBASE_SIF`` and ``TAUBASE_GMT`` environment variables,
+    then from the data directory of a source checkout. The GMT export is optional.
+
+    :raises FileNotFoundError: if the SIF export can not be found
+    """
+    sif_path = sif_path or os.environ.get('TAUBASE_SIF') or SIF_PATH
+    if not os.path.exists(sif_path):
+        raise FileNotFoundError(f'Missing SIF export at {sif_path}. Set TAUBASE_SIF or use taubase web --sif.')
+
+    gmt_path = gmt_path or os.environ.get('TAUBASE_GMT')
+    if gmt_path is None and os.path.exists(GMT_PATH):
+        gmt_path = GMT_PATH
+
+    return LiteGraph.from_paths(sif_path=sif_path, gmt_path=gmt_path)
+
+
+def is_hgnc_protein_bel(bel: str, hgnc_gene_symbol: str) -> bool:
+    """Check if the BEL term is the given HGNC protein, including its variants and modifiers like ``act()``."""
+    return re.match(_get_hgnc_protein_pattern(hgnc_gene_symbol), bel) is not None
+
+
+def _get_hgnc_protein_pattern(hgnc_gene_symbol: str) -> str:
+    return r'(?:(?:{})\()?p\(HGNC:(?:{}|"{}")[,)]'.format(
+        '|'.join(MODIFIER_FUNCTIONS),
+        re.escape(hgnc_gene_symbol),
+        re.escape(hgnc_gene_symbol),
+    )
+
+
+def get_lite_neighborhood(graph: LiteGraph, hgnc_gene_symbol: str = 'MAPT') -> Iterable[EdgeTuple]:
+    """Iterate over the edges incident to the given HGNC protein."""
+    node_ids = (
+        node_id
+        for node_id, node in enumerate(graph.nodes)
+        if is_hgnc_protein_bel(node, hgnc_gene_symbol)
+    )
+    for edge_id in graph.get_neighborhood_edge_ids(node_ids):
+        yield graph.get_edge(edge_id)
+
+
+def get_lite_edges(graph: LiteGraph, hgnc_gene_symbol: str = 'MAPT') -> Iterable[Tuple[str, None, None]]:
+    """Iterate over rows like :func:`taubase.getters.get_edges`, which the SIF export has no references for."""
+    for source, relation, target in get_lite_neighborhood(graph, hgnc_gene_symbol):
+        yield f'{source} {relation} {target}', None, None
@@ -3,7 +3,6 @@
 """Graph getting functions."""
 
 import logging
-import os
 from functools import partial
 
 import hbp_enrichment
@@ -11,6 +10,7 @@ import hbp_knowledge
 import hbp_semi_automated_curation
 from pybel import union
 
+from .constants import DATA_DIRECTORY
 from .drepo import DistributedRepo
 from .version import VERSION
 
@@ -22,9 +22,6 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
-HERE = os.path.abspath(os.path.dirname(__file__))
-DATA_DIRECTORY = os.path.abspath(os.path.join(HERE, os.pardir, os.pardir, 'data'))
-
 repository = DistributedRepo(
     name='TauBase',
     version=VERSION,
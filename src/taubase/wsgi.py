@@ -9,8 +9,8 @@ from flask import Flask, jsonify, render_template, request
 from flask_bootstrap import Bootstrap
 
 from taubase.getters import (
-    _get_protein_modifiers_rows, get_edges, get_fragments_rows, get_kinases, get_mutations_rows,
-    get_tau_aggregation_modifiers_rows, get_tau_modifiers, get_tau_references, get_variants_rows,
+    _get_protein_modifiers_rows, get_edges, get_fragments_rows, get_kinases, get_modifier_site_matrix,
+    get_mutations_rows, get_tau_aggregation_modifiers_rows, get_tau_modifiers, get_tau_references, get_variants_rows,
 )
 from taubase.repository import get_graph
 
@@ -119,6 +119,13 @@ def tau_modifiers_json():
     return jsonify(df.to_json(index=False))
 
 
+@app.route('/modifiers/matrix.json')
+def modifier_site_matrix_json():
+    """Show the counts of modifiers by modification site of the Tau protein."""
+    matrix = get_modifier_site_matrix(graph, _get_hgnc_gene_symbol())
+    return jsonify(matrix.to_dict())
+
+
 @app.route('/kinases.json')
 def kinases_json():
     """Show the kinases in the graph."""
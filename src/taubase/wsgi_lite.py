@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""Run TauBase in lite mode, serving from the exports shipped in the data directory."""
+
+import logging
+
+from flask import Flask, jsonify, render_template, request
+from flask_bootstrap import Bootstrap
+
+from taubase.lite import get_lite_edges, get_lite_graph, get_lite_neighborhood
+
+logger = logging.getLogger(__name__)
+
+graph = get_lite_graph()
+
+
+app = Flask(__name__)
+Bootstrap(app)
+
+
+def _get_hgnc_gene_symbol():
+    return request.args.get('hgnc_gene_symbol', default='MAPT')
+
+
+@app.route('/')
+def home():
+    """Show the home page."""
+    return render_template('lite.html', name=graph.name, summary=graph.summary_dict())
+
+
+@app.route('/summary.json')
+def summary_json():
+    """Return a summary of the contents of the graph."""
+    return jsonify(graph.summary_dict())
+
+
+@app.route('/edges')
+def edges():
+    """Show the edges with the Tau protein."""
+    return render_template('edges.html', rows=list(get_lite_edges(graph, _get_hgnc_gene_symbol())))
+
+
+"""JSON Endpoints"""
+
+
+@app.route('/edges.json')
+def edges_json():
+    """Return the edges with the Tau protein."""
+    return jsonify([
+        dict(zip(('source', 'relation', 'target'), edge))
+        for edge in get_lite_neighborhood(graph, _get_hgnc_gene_symbol())
+    ])
+
+
+@app.route('/neighborhood.json')
+def neighborhood_json():
+    """Return the edges incident to the BEL term given with the ``node`` argument."""
+    node_id = graph.node_to_id.get(request.args.get('node'))
+    if node_id is None:
+        return jsonify([]), 404
+    return jsonify([
+        dict(zip(('source', 'relation', 'target'), graph.get_edge(edge_id)))
+        for edge_id in graph.get_neighborhood_edge_ids([node_id])
+    ])
+
+
+@app.route('/genes.json')
+def genes_json():
+    """Return the gene sets."""
+    return jsonify(graph.gene_sets)
+
+
+if __name__ == '__main__':
+    app.run()
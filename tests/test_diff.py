@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for computing deltas between builds."""
+
+import io
+import json
+import unittest
+
+from pybel import BELGraph
+from pybel.dsl import Protein
+
+from taubase.diff import get_manifest, get_version_slug, hash_edge, iterate_patches, write_patches
+
+a, b, c = (Protein('HGNC', name) for name in ('A', 'B', 'C'))
+
+
+def _make_graph(version: str) -> BELGraph:
+    graph = BELGraph(name='test', version=version)
+    graph.add_increases(a, b, citation='1', evidence='a increases b')
+    return graph
+
+
+class TestDiff(unittest.TestCase):
+    """Tests for computing deltas between builds."""
+
+    def setUp(self):
+        """Build two versions of a graph where one edge and node is removed and another is added."""
+        old_graph = _make_graph('1.0.0')
+        old_graph.add_decreases(a, c, citation='2', evidence='a decreases c')
+        self.old = get_manifest(old_graph)
+
+        new_graph = _make_graph('1.1.0')
+        new_graph.add_increases(b, a, citation='3', evidence='b increases a')
+        new_graph.add_increases(b, a, citation='3', evidence='b also increases a')
+        self.new = get_manifest(new_graph)
+
+    def test_version_slug(self):
+        """Test versions are made safe for file names."""
+        self.assertEqual('0.0.1-dev_0.0.5_0.1.1', get_version_slug('0.0.1-dev (0.0.5/0.1.1)'))
+
+    def test_manifest(self):
+        """Test the manifest has an entry for each node and edge."""
+        self.assertEqual('1.1.0', self.new['version'])
+        self.assertEqual(2, len(self.new['nodes']))
+        self.assertEqual(3, len(self.new['edges']))
+
+    def test_patch_order(self):
+        """Test patches are ordered by edge removals, node removals, node additions, then edge additions."""
+        patches = list(iterate_patches(self.old, self.new))
+        self.assertEqual(
+            [('remove', 'edge'), ('remove', 'node'), ('add', 'edge'), ('add', 'edge')],
+            [(patch['op'], patch['type']) for patch in patches],
+        )
+        self.assertEqual([], list(iterate_patches(self.new, self.new)))
+
+    def test_edge_additions(self):
+        """Test added edges carry enough information to be rebuilt, including their evidence."""
+        additions = [patch for patch in iterate_patches(self.old, self.new) if patch['op'] == 'add']
+        self.assertEqual(2, len({patch['id'] for patch in additions}))
+        self.assertEqual({'b increases a', 'b also increases a'}, {patch['evidence'] for patch in additions})
+        for patch in additions:
+            self.assertEqual(self.new['nodes'][patch['source']], b.as_bel())
+            self.assertEqual(self.new['nodes'][patch['target']], a.as_bel())
+            self.assertEqual(['PubMed', '3'], patch['citation'])
+
+    def test_annotations_changed(self):
+        """Test an edge whose annotations change is removed and added again."""
+        old_graph, new_graph = _make_graph('1.0.0'), _make_graph('1.1.0')
+        old_graph.add_increases(b, c, citation='4', evidence='b increases c', annotations={'Species': '9606'})
+        new_graph.add_increases(b, c, citation='4', evidence='b increases c', annotations={'Species': '10090'})
+
+        patches = list(iterate_patches(get_manifest(old_graph), get_manifest(new_graph)))
+        self.assertEqual([('remove', 'edge'), ('add', 'edge')], [(patch['op'], patch['type']) for patch in patches])
+        self.assertEqual({'Species': {'10090': True}}, patches[1]['annotations'])
+
+    def test_hash_edge(self):
+        """Test the edge hash covers the annotations but not the order they were given in."""
+        data = {
+            'relation': 'increases',
+            'citation': {'type': 'PubMed', 'reference': '5'},
+            'evidence': 'e',
+            'annotations': {'Species': {'9606': True}, 'Cell': {'neuron': True}},
+        }
+        reordered_data = dict(data, annotations={'Cell': {'neuron': True}, 'Species': {'9606': True}})
+        changed_data = dict(data, annotations={'Species': {'10090': True}, 'Cell': {'neuron': True}})
+
+        self.assertEqual(hash_edge(a, b, data), hash_edge(a, b, reordered_data))
+        self.assertNotEqual(hash_edge(a, b, data), hash_edge(a, b, changed_data))
+        self.assertNotEqual(hash_edge(a, b, data), hash_edge(b, a, data))
+
+    def test_write_patches(self):
+        """Test patches are written as one JSON object per line."""
+        file = io.StringIO()
+        count = write_patches(iterate_patches(self.old, self.new), file)
+        lines = file.getvalue().splitlines()
+        self.assertEqual(4, count)
+        self.assertEqual(list(iterate_patches(self.old, self.new)), [json.loads(line) for line in lines])
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the distributed repository."""
+
+import os
+import pickle
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+from pybel import BELGraph
+from pybel.dsl import Protein
+
+from taubase.drepo import DistributedRepo, _iterate_edge_chunks, get_graph_fingerprint
+
+mapt = Protein('HGNC', 'MAPT')
+gsk3b = Protein('HGNC', 'GSK3B')
+cdk5 = Protein('HGNC', 'CDK5')
+fyn = Protein('HGNC', 'FYN')
+
+EDGES = [
+    (gsk3b, mapt, '1'),
+    (cdk5, mapt, '2'),
+    (mapt, fyn, '3'),
+    (cdk5, gsk3b, '4'),
+    (fyn, cdk5, '5'),
+]
+
+
+def _make_graph(edges=EDGES) -> BELGraph:
+    graph = BELGraph(name='test', version='1.0.0')
+    for source, target, citation in edges:
+        graph.add_increases(source, target, citation=citation, evidence=f'evidence {citation}')
+    return graph
+
+
+def _fake_to_indra_statements(graph: BELGraph):
+    """Stand in for :func:`pybel.to_indra_statements` with one string per edge."""
+    return sorted(
+        graph.edge_to_bel(source, target, data, sep=' ')
+        for source, target, data in graph.edges(data=True)
+    )
+
+
+class TestFingerprint(unittest.TestCase):
+    """Tests for graph fingerprints."""
+
+    def test_order(self):
+        """Test the fingerprint does not depend on the order edges are added."""
+        self.assertEqual(get_graph_fingerprint(_make_graph()), get_graph_fingerprint(_make_graph(EDGES[::-1])))
+
+    def test_changed(self):
+        """Test the fingerprint changes when an edge is removed."""
+        self.assertNotEqual(get_graph_fingerprint(_make_graph()), get_graph_fingerprint(_make_graph(EDGES[1:])))
+
+
+class TestChunks(unittest.TestCase):
+    """Tests for splitting graphs into chunks for conversion."""
+
+    def setUp(self):
+        """Build the graph."""
+        self.graph = _make_graph()
+
+    def _get_chunk_edges(self, chunks):
+        return [
+            (source, target, key)
+            for chunk in chunks
+            for source, target, key in chunk.edges(keys=True)
+        ]
+
+    def test_chunks(self):
+        """Test each edge is in exactly one chunk."""
+        chunks = list(_iterate_edge_chunks(self.graph, chunk_size=2))
+        self.assertEqual([2, 2, 1], [chunk.number_of_edges() for chunk in chunks])
+
+        chunk_edges = self._get_chunk_edges(chunks)
+        self.assertEqual(len(chunk_edges), len(set(chunk_edges)))
+        self.assertEqual(set(self.graph.edges(keys=True)), set(chunk_edges))
+
+    def test_filter(self):
+        """Test only the edges incident to the given protein are chunked."""
+        chunks = list(_iterate_edge_chunks(self.graph, chunk_size=2, hgnc_gene_symbol='MAPT'))
+        chunk_edges = self._get_chunk_edges(chunks)
+        self.assertEqual(3, len(chunk_edges))
+        self.assertTrue(all(mapt in (source, target) for source, target, _ in chunk_edges))
+
+
+@mock.patch.dict(sys.modules, {'indra': types.ModuleType('indra')})
+@mock.patch('pybel.to_indra_statements', side_effect=_fake_to_indra_statements)
+class TestIndraCache(unittest.TestCase):
+    """Tests for caching INDRA statements."""
+
+    def setUp(self):
+        """Make a repository in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.repository = DistributedRepo(name='test', version='1.0.0', repositories=[], directory=self.directory.name)
+        self.indra_path = os.path.join(self.directory.name, 'test.indra.pickle')
+        self.graph = _make_graph()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_cached(self, to_indra_statements):
+        """Test statements are only converted once for the same graph and are exported as a list."""
+        statements = self.repository.get_indra_statements(graph=self.graph)
+        self.assertEqual(_fake_to_indra_statements(self.graph), statements)
+        self.assertEqual(1, to_indra_statements.call_count)
+
+        with open(self.indra_path, 'rb') as file:
+            self.assertEqual(statements, pickle.load(file))
+
+        self.assertEqual(statements, self.repository.get_indra_statements(graph=_make_graph(EDGES[::-1])))
+        self.assertEqual(1, to_indra_statements.call_count)
+
+    def test_stale(self, to_indra_statements):
+        """Test statements are converted again when the graph changes."""
+        self.repository.get_indra_statements(graph=self.graph)
+        graph = _make_graph(EDGES[1:])
+        self.assertEqual(_fake_to_indra_statements(graph), self.repository.get_indra_statements(graph=graph))
+        self.assertEqual(2, to_indra_statements.call_count)
+
+    def test_legacy(self, to_indra_statements):
+        """Test a bare list of statements without a fingerprint is converted again."""
+        with open(self.indra_path, 'wb') as file:
+            pickle.dump(['legacy'], file)
+
+        statements = self.repository.get_indra_statements(graph=self.graph)
+        self.assertEqual(_fake_to_indra_statements(self.graph), statements)
+        self.assertEqual(1, to_indra_statements.call_count)
+
+    def test_not_cached(self, to_indra_statements):
+        """Test the cache is skipped when asked."""
+        self.repository.get_indra_statements(graph=self.graph)
+        self.repository.get_indra_statements(graph=self.graph, use_cached=False)
+        self.assertEqual(2, to_indra_statements.call_count)
+
+    def test_missing_indra(self, to_indra_statements):
+        """Test conversion fails before doing any work if INDRA is not installed."""
+        with mock.patch.dict(sys.modules, {'indra': None}):
+            with self.assertRaises(ImportError):
+                self.repository.get_indra_statements(graph=self.graph)
+        self.assertEqual(0, to_indra_statements.call_count)
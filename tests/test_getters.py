@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the getters."""
+
+import unittest
+
+from pybel import BELGraph
+from pybel.constants import REGULATES
+from pybel.dsl import Protein, ProteinModification
+
+from taubase.getters import get_modifier_site_matrix
+
+gsk3b = Protein('HGNC', 'GSK3B')
+cdk5 = Protein('HGNC', 'CDK5')
+pp2a = Protein('HGNC', 'PPP2CA')
+mapt_ser396 = Protein('HGNC', 'MAPT', variants=[ProteinModification('Ph', code='Ser', position=396)])
+
+
+class TestModifierSiteMatrix(unittest.TestCase):
+    """Tests for the modifier by site matrix."""
+
+    def setUp(self):
+        """Build a graph with increasing, decreasing, and non-polar modifiers of MAPT."""
+        self.graph = BELGraph()
+        self.graph.add_directly_increases(gsk3b, mapt_ser396, citation='1', evidence='gsk3b')
+        self.graph.add_increases(gsk3b, mapt_ser396, citation='2', evidence='gsk3b again')
+        self.graph.add_directly_decreases(pp2a, mapt_ser396, citation='3', evidence='pp2a')
+        self.graph.add_qualified_edge(cdk5, mapt_ser396, relation=REGULATES, citation='4', evidence='cdk5')
+
+        self.matrix = get_modifier_site_matrix(self.graph)
+
+    def _get_count(self, category: str, modifier: Protein) -> int:
+        row = self.matrix.modifiers.index((modifier.namespace, modifier.name))
+        return self.matrix.counts[category][row, 0]
+
+    def test_cached(self):
+        """Test the matrix is only built once per graph."""
+        self.assertIs(self.matrix, get_modifier_site_matrix(self.graph))
+
+    def test_sites(self):
+        """Test there is one column for the site."""
+        self.assertEqual([('Ph', 'Ser', 396)], self.matrix.sites)
+
+    def test_polarity(self):
+        """Test non-polar relations like regulates are not counted as increases or decreases."""
+        self.assertEqual(2, self._get_count('increase', gsk3b))
+        self.assertEqual(0, self._get_count('decrease', gsk3b))
+        self.assertEqual(1, self._get_count('decrease', pp2a))
+        self.assertEqual(0, self._get_count('increase', cdk5))
+        self.assertEqual(0, self._get_count('decrease', cdk5))
+        self.assertEqual(1, self._get_count('nonpolar', cdk5))
+        self.assertEqual(1, self._get_count('total', cdk5))
+
+    def test_direct(self):
+        """Test counts are split into direct and indirect relations."""
+        self.assertEqual(1, self._get_count('direct', gsk3b))
+        self.assertEqual(1, self._get_count('indirect', gsk3b))
+        self.assertEqual(1, self._get_count('indirect', cdk5))
+
+    def test_top_modifiers(self):
+        """Test the modifier with the most edges is ranked first for the site."""
+        top = self.matrix.get_top_modifiers(k=1)
+        self.assertEqual(['GSK3B'], top['name'].tolist())
+        self.assertEqual([2], top['count'].tolist())
+
+        top = self.matrix.get_top_modifiers(k=5)
+        self.assertEqual(['GSK3B', 'CDK5', 'PPP2CA'], top['name'].tolist())
+        self.assertEqual([1, 2, 3], top['rank'].tolist())
+
+    def test_to_frame(self):
+        """Test the long data frame has a row for each modifier at the site."""
+        df = self.matrix.to_frame()
+        self.assertEqual(3, len(df.index))
+        row = df[df['name'] == 'CDK5'].iloc[0]
+        self.assertEqual(1, row['nonpolar'])
+        self.assertEqual(0, row['decrease'])
+
+    def test_to_dict(self):
+        """Test the counts are given in coordinate format."""
+        rv = self.matrix.to_dict()
+        self.assertEqual('MAPT', rv['hgnc_gene_symbol'])
+        self.assertEqual(4, sum(rv['counts']['total']['data']))
+
+
+class TestEmptyModifierSiteMatrix(unittest.TestCase):
+    """Tests for the modifier by site matrix of a graph without any modifications of the protein."""
+
+    def setUp(self):
+        """Build the matrix for an empty graph."""
+        self.matrix = get_modifier_site_matrix(BELGraph())
+
+    def test_empty(self):
+        """Test all outputs are empty instead of failing."""
+        self.assertEqual([], self.matrix.modifiers)
+        self.assertEqual([], self.matrix.sites)
+        self.assertEqual(0, len(self.matrix.to_frame().index))
+        self.assertEqual(0, len(self.matrix.get_top_modifiers().index))
+        self.assertEqual([], self.matrix.to_dict()['counts']['total']['data'])
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the lite backend."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from array import array
+
+from taubase.lite import LiteGraph, _build_csr, _read_gmt, get_lite_edges, get_lite_neighborhood, is_hgnc_protein_bel
+
+SIF = """\
+p(HGNC:GSK3B)\tdirectlyIncreases\tp(HGNC:MAPT, pmod(Ph, Ser, 396))
+act(p(HGNC:CDK5))\tincreases\tp(HGNC:MAPT)
+p(HGNC:MAPT)\tincreases\ta(HBP:"Tau aggregates")
+a(CHEBI:lithium)\tdecreases\tact(p(HGNC:GSK3B), ma(kin))
+a(CHEBI:lithium)\tdecreases\tact(p(HGNC:MAPT))
+deg(p(HGNC:MAPT))\tnegativeCorrelation\tpath(MESH:"Alzheimer Disease")
+complex(p(HGNC:FYN), p(HGNC:MAPT))\tincreases\tbp(GO:"neuron death")
+p(HGNC:MAPTA)\tincreases\tbp(GO:"neuron death")
+"""
+
+GMT = """\
+# TauBase
+CDK5
+GSK3B
+MAPT
+"""
+
+
+class TestLite(unittest.TestCase):
+    """Tests for the lite backend."""
+
+    def setUp(self):
+        """Write the SIF and GMT fixtures and read them."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.sif_path = os.path.join(self.directory.name, 'test.bel.sif')
+        with open(self.sif_path, 'w') as file:
+            file.write(SIF)
+        self.gmt_path = os.path.join(self.directory.name, 'test.bel.gmt')
+        with open(self.gmt_path, 'w') as file:
+            file.write(GMT)
+
+        self.graph = LiteGraph.from_paths(self.sif_path, self.gmt_path)
+
+    def tearDown(self):
+        """Remove the fixtures."""
+        self.directory.cleanup()
+
+    def test_build_csr(self):
+        """Test the offsets and indexes group the keys by value."""
+        offsets, indexes = _build_csr(array('I', [2, 0, 2, 1, 0]), 4)
+        self.assertEqual([0, 2, 3, 5, 5], offsets.tolist())
+        self.assertEqual([1, 4, 3, 0, 2], indexes.tolist())
+
+    def test_read_gmt(self):
+        """Test reading the single gene set format written by PyBEL."""
+        self.assertEqual({'TauBase': ['CDK5', 'GSK3B', 'MAPT']}, _read_gmt(self.gmt_path))
+
+    def test_graph(self):
+        """Test the graph has all nodes, edges, and gene sets."""
+        self.assertEqual('TauBase', self.graph.name)
+        self.assertEqual(8, self.graph.number_of_edges())
+        self.assertEqual(13, self.graph.number_of_nodes())
+        self.assertEqual({'CDK5', 'GSK3B', 'MAPT'}, self.graph.get_genes())
+
+        node_id = self.graph.node_to_id['a(CHEBI:lithium)']
+        self.assertEqual([3, 4], self.graph.out_edge_ids(node_id).tolist())
+        self.assertEqual([], self.graph.in_edge_ids(node_id).tolist())
+
+    def test_is_hgnc_protein_bel(self):
+        """Test matching a protein with its variants and modifiers, but not in complexes."""
+        for bel in ('p(HGNC:MAPT)', 'p(HGNC:"MAPT")', 'p(HGNC:MAPT, pmod(Ph))', 'act(p(HGNC:MAPT), ma(kin))',
+                    'deg(p(HGNC:MAPT))'):
+            with self.subTest(bel=bel):
+                self.assertTrue(is_hgnc_protein_bel(bel, 'MAPT'))
+        for bel in ('p(HGNC:MAPTA)', 'g(HGNC:MAPT)', 'complex(p(HGNC:FYN), p(HGNC:MAPT))'):
+            with self.subTest(bel=bel):
+                self.assertFalse(is_hgnc_protein_bel(bel, 'MAPT'))
+
+    def test_neighborhood(self):
+        """Test the edges incident to MAPT match those full mode gets from the graph."""
+        edges = list(get_lite_neighborhood(self.graph, 'MAPT'))
+        self.assertEqual(
+            [self.graph.get_edge(edge_id) for edge_id in (0, 1, 2, 4, 5)],
+            edges,
+        )
+        rows = list(get_lite_edges(self.graph, 'MAPT'))
+        self.assertEqual(5, len(rows))
+        self.assertEqual(('p(HGNC:GSK3B) directlyIncreases p(HGNC:MAPT, pmod(Ph, Ser, 396))', None, None), rows[0])
+
+
+class TestImports(unittest.TestCase):
+    """Tests for importing the lite backend."""
+
+    def test_no_repository(self):
+        """Test importing the lite backend does not import the repository, PyBEL, or the HBP repositories."""
+        code = (
+            'import sys, taubase.lite; '
+            'sys.exit(any(m in sys.modules for m in ("taubase.repository", "pybel", "hbp_knowledge")))'
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, '-c', code], check=True, env=env)